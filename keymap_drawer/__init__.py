@@ -1,6 +1,19 @@
 """Parent module containing all keymap-drawer functionality."""
 
 import logging
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml bindings
+    from yaml import SafeLoader  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(format="{name}: [{levelname}] {message}", style="{")
+
+
+def yaml_load(stream: str | IO) -> Any:
+    """Safe-load YAML from a string or stream, using the libyaml-based loader if available."""
+    return yaml.load(stream, Loader=SafeLoader)
@@ -12,7 +12,7 @@ from pathlib import Path
 
 import yaml
 
-from keymap_drawer import logger
+from keymap_drawer import logger, yaml_load
 from keymap_drawer.config import Config, DrawConfig
 from keymap_drawer.draw import KeymapDrawer
 from keymap_drawer.keymap import KeymapData
@@ -32,7 +32,7 @@ def draw(args: Namespace, config: Config) -> None:
     """Draw the keymap in SVG format to stdout."""
     yaml_data: dict[str, dict] = {}
     for yaml_arg in args.keymap_yaml:
-        yaml_data = _merge_keymaps(yaml_data, yaml.safe_load(yaml_arg))
+        yaml_data = _merge_keymaps(yaml_data, yaml_load(yaml_arg))
 
     cli_layout = {
         k: v
@@ -81,7 +81,7 @@ def draw(args: Namespace, config: Config) -> None:
 def parse(args: Namespace, config: Config) -> None:
     """Call the appropriate parser for given args and dump YAML keymap representation to stdout."""
     if args.base_keymap:
-        yaml_data = yaml.safe_load(args.base_keymap)
+        yaml_data = yaml_load(args.base_keymap)
         base = KeymapData(
             layers=yaml_data.get("layers", {}), combos=yaml_data.get("combos", []), layout=None, config=None
         )
@@ -178,7 +178,7 @@ def main() -> None:
         "--ortho-layout",
         help="Parametrized ortholinear layout definition in a YAML format, "
         "for example '{split: false, rows: 4, columns: 12}'",
-        type=yaml.safe_load,
+        type=yaml_load,
     )
     draw_p.add_argument(
         "-n",
@@ -274,7 +274,7 @@ def main() -> None:
     if args.debug:
         logger.setLevel(logging.DEBUG)
 
-    config = Config.parse_obj(yaml.safe_load(args.config)) if args.config else Config()
+    config = Config.parse_obj(yaml_load(args.config)) if args.config else Config()
 
     match args.command:
         case "draw":
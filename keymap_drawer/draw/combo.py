@@ -98,7 +98,8 @@ class ComboDrawerMixin(UtilsMixin):
                     p_mid.y,
                 )
 
-        class_str = self._to_class_str(["combo", combo.type, combo.key.type, f"combopos-{combo_ind}"])
+        combo_classes = ["combo", combo.type, combo.key.type]
+        class_str = self._to_class_str([*combo_classes, f"combopos-{combo_ind}"])
         self.out.write(f"<g{class_str}>\n")
 
         # draw dendrons going from box to combo keys
@@ -132,37 +133,37 @@ class ComboDrawerMixin(UtilsMixin):
             p,
             Point(width, height),
             Point(self.cfg.key_rx, self.cfg.key_ry),
-            classes=["combo", combo.type, combo.key.type],
+            classes=combo_classes,
         )
 
         self._draw_legend(
             p,
             self._split_text(combo.key.tap, truncate=2, line_width=self.cfg.shrink_wide_legends),
-            classes=["combo", combo.type, combo.key.type],
+            classes=combo_classes,
             legend_type="tap",
         )
         self._draw_legend(
             p + Point(0, self.cfg.combo_h / 2 - self.cfg.small_pad),
             [combo.key.hold],
-            classes=["combo", combo.type, combo.key.type],
+            classes=combo_classes,
             legend_type="hold",
         )
         self._draw_legend(
             p - Point(0, self.cfg.combo_h / 2 - self.cfg.small_pad),
             [combo.key.shifted],
-            classes=["combo", combo.type, combo.key.type],
+            classes=combo_classes,
             legend_type="shifted",
         )
         self._draw_legend(
             p - Point(self.cfg.combo_w / 2 - self.cfg.small_pad, 0),
             [combo.key.left],
-            classes=["combo", combo.type, combo.key.type],
+            classes=combo_classes,
             legend_type="left",
         )
         self._draw_legend(
             p + Point(self.cfg.combo_w / 2 - self.cfg.small_pad, 0),
             [combo.key.right],
-            classes=["combo", combo.type, combo.key.type],
+            classes=combo_classes,
             legend_type="right",
         )
         if combo.rotation != 0.0:
@@ -26,7 +26,7 @@ class KeymapDrawer(ComboDrawerMixin, UtilsMixin):
         assert self.keymap.layout is not None, "A PhysicalLayout must be provided for drawing"
         assert self.keymap.config is not None, "A Config must be provided for drawing"
         self.layout = self.keymap.layout
-        self.layer_names = set()
+        self.layer_ids: dict[str, str] = {}
         self.output_stream = out
         self.out = StringIO()
 
@@ -44,7 +44,7 @@ class KeymapDrawer(ComboDrawerMixin, UtilsMixin):
             f"{self.cfg.footer_text}</text>"
         )
 
-    def print_key(self, p_key: PhysicalKey, l_key: LayoutKey, key_ind: int) -> None:
+    def print_key(self, p_key: PhysicalKey, l_key: LayoutKey, key_ind: int) -> None:  # pylint: disable=too-many-locals
         """
         Print SVG code for a rectangle with text representing the key, which is described by its physical
         representation (p_key) and what it does in the given layer (l_key).
@@ -56,10 +56,11 @@ class KeymapDrawer(ComboDrawerMixin, UtilsMixin):
         )
         rotate_str = f" rotate({p_key.rotation})" if p_key.rotation != 0 else ""
         transform_attr = f' transform="translate({round(p.x)}, {round(p.y)}){rotate_str}"'
-        class_str = self._to_class_str(["key", l_key.type, f"keypos-{key_ind}"])
+        key_classes = ["key", l_key.type]
+        class_str = self._to_class_str([*key_classes, f"keypos-{key_ind}"])
         self.out.write(f"<g{transform_attr}{class_str}>\n")
 
-        self._draw_key(Point(w - 2 * self.cfg.inner_pad_w, h - 2 * self.cfg.inner_pad_h), classes=["key", l_key.type])
+        self._draw_key(Point(w - 2 * self.cfg.inner_pad_w, h - 2 * self.cfg.inner_pad_h), classes=key_classes)
         if p_key.is_iso_enter:
             self.out.write(
                 f'<g transform="translate({round(-w / 10)}, {round(-h / 4)})" '
@@ -67,7 +68,7 @@ class KeymapDrawer(ComboDrawerMixin, UtilsMixin):
             )
             self._draw_key(
                 Point(w * 6 / 5 - 2 * self.cfg.inner_pad_w, h / 2 - 2 * self.cfg.inner_pad_h),
-                classes=["key", l_key.type],
+                classes=key_classes,
             )
             self.out.write("</g>\n")
 
@@ -92,32 +93,32 @@ class KeymapDrawer(ComboDrawerMixin, UtilsMixin):
         self._draw_legend(
             tap_shift,
             tap_words,
-            classes=["key", l_key.type],
+            classes=key_classes,
             legend_type="tap",
             shift=shift,
         )
         self._draw_legend(
             Point(0, y_offset),
             [l_key.hold],
-            classes=["key", l_key.type],
+            classes=key_classes,
             legend_type="hold",
         )
         self._draw_legend(
             Point(0, -y_offset),
             [l_key.shifted],
-            classes=["key", l_key.type],
+            classes=key_classes,
             legend_type="shifted",
         )
         self._draw_legend(
             Point(-x_offset, 0),
             [l_key.left],
-            classes=["key", l_key.type],
+            classes=key_classes,
             legend_type="left",
         )
         self._draw_legend(
             Point(x_offset, 0),
             [l_key.right],
-            classes=["key", l_key.type],
+            classes=key_classes,
             legend_type="right",
         )
 
@@ -125,25 +126,25 @@ class KeymapDrawer(ComboDrawerMixin, UtilsMixin):
         self._draw_legend(
             Point(-x_offset, -y_offset),
             [l_key.tl],
-            classes=["key", l_key.type],
+            classes=key_classes,
             legend_type="tl",
         )
         self._draw_legend(
             Point(x_offset, -y_offset),
             [l_key.tr],
-            classes=["key", l_key.type],
+            classes=key_classes,
             legend_type="tr",
         )
         self._draw_legend(
             Point(-x_offset, y_offset),
             [l_key.bl],
-            classes=["key", l_key.type],
+            classes=key_classes,
             legend_type="bl",
         )
         self._draw_legend(
             Point(x_offset, y_offset),
             [l_key.br],
-            classes=["key", l_key.type],
+            classes=key_classes,
             legend_type="br",
         )
 
@@ -222,7 +223,7 @@ class KeymapDrawer(ComboDrawerMixin, UtilsMixin):
         # get final set of layers and combos per layer given the drawing options
         layers, combos_per_layer = _resolve_layers_combos(self.keymap, draw_layers, keys_only, combos_only, ghost_keys)
 
-        self.layer_names = set(layers)
+        self.layer_ids = {name: self._str_to_id(name) for name in layers}  # for layer activator links
 
         # write to internal output stream self.out
         p = self.print_layers(Point(0, 0), self.layout, layers, combos_per_layer, self.cfg.n_columns)
@@ -272,7 +273,7 @@ def _resolve_layers_combos(
     combos_only: bool = False,
     ghost_keys: Sequence[int] | None = None,
 ) -> tuple[dict[str, list[LayoutKey]], dict[str, list[ComboSpec]]]:
-    layers = deepcopy(keymap.layers)
+    layers = keymap.layers
     if draw_layers:
         assert all(l in layers for l in draw_layers), "Some layer names selected for drawing are not in the keymap"
         layers = {name: layer for name, layer in layers.items() if name in draw_layers}
@@ -292,6 +293,8 @@ def _resolve_layers_combos(
             for name, combos in combos_per_layer.items()
             if combos
         }
+    else:  # only copy the layers that will be drawn, since keys can get modified below
+        layers = deepcopy(layers)
 
     if ghost_keys:
         for key_position in ghost_keys:
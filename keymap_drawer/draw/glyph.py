@@ -72,9 +72,13 @@ class GlyphMixin:
                 f'Glyphs "{rest}" are not defined in draw_config.glyphs or fetchable using draw_config.glyph_urls'
             )
 
+        # parse viewbox dimensions once here rather than on every drawn glyph
+        self.name_to_dims: dict[str, tuple[float, float]] = {}
         for name, svg in self.name_to_svg.items():
-            if not self._view_box_dimensions_re.match(svg):
+            if not (view_box := self._view_box_dimensions_re.match(svg)):
                 raise ValueError(f'Glyph definition for "{name}" does not have the required "viewbox" property')
+            _, _, w, h = (float(v) for v in view_box.groups())
+            self.name_to_dims[name] = (w, h)
 
     def _fetch_glyphs(self, names: Iterable[str]) -> dict[str, str]:
         names = list(names)
@@ -100,7 +104,7 @@ class GlyphMixin:
 
     @classmethod
     def _legend_to_name(cls, legend: str) -> str | None:
-        if m := cls._glyph_name_re.search(legend):
+        if "$$" in legend and (m := cls._glyph_name_re.search(legend)):  # skip the regex for most legends
             return m.group("glyph")
         return None
 
@@ -115,19 +119,15 @@ class GlyphMixin:
         if not self.name_to_svg:
             return ""
 
-        defs = "<defs>/* start glyphs */\n"
-        for name, svg in sorted(self.name_to_svg.items()):
-            defs += f'<svg id="{name}">\n'
-            defs += self._scrub_dims_re.sub("", svg)
-            defs += "\n</svg>\n"
-        defs += "</defs>/* end glyphs */\n"
-        return defs
+        glyphs = "".join(
+            f'<svg id="{name}">\n{self._scrub_dims_re.sub("", svg)}\n</svg>\n'
+            for name, svg in sorted(self.name_to_svg.items())
+        )
+        return f"<defs>/* start glyphs */\n{glyphs}</defs>/* end glyphs */\n"
 
     def get_glyph_dimensions(self, name: str, legend_type: str) -> tuple[float, float, float, float]:
         """Given a glyph name, calculate and return its width, height and y-offset for drawing."""
-        view_box = self._view_box_dimensions_re.match(self.name_to_svg[name])
-        assert view_box is not None
-        _, _, w, h = (float(v) for v in view_box.groups())
+        w, h = self.name_to_dims[name]
 
         # set dimensions and offsets from center
         match legend_type:
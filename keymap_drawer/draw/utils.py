@@ -2,6 +2,7 @@
 
 import re
 import string
+from functools import cache
 from html import escape
 from io import StringIO
 from textwrap import TextWrapper
@@ -12,6 +13,12 @@ from keymap_drawer.draw.glyph import GlyphMixin
 from keymap_drawer.physical_layout import Point
 
 LegendType = Literal["tap", "hold", "shifted", "left", "right", "tl", "tr", "bl", "br"]
+ID_ALLOWED_CHARS = frozenset(string.ascii_letters + string.digits + "-_:.")
+
+
+@cache
+def _get_text_wrapper(line_width: int) -> TextWrapper:
+    return TextWrapper(width=line_width, break_long_words=False, break_on_hyphens=False)
 
 
 class UtilsMixin(GlyphMixin):
@@ -19,7 +26,7 @@ class UtilsMixin(GlyphMixin):
 
     # initialized in KeymapDrawer
     cfg: DrawConfig
-    layer_names: set[str]
+    layer_ids: dict[str, str]
     out: StringIO
 
     @staticmethod
@@ -31,8 +38,7 @@ class UtilsMixin(GlyphMixin):
             val = val[1:]
             if not val:
                 return "x_x"
-        allowed = string.ascii_letters + string.digits + "-_:."
-        return "".join([c for c in val if c in allowed])
+        return "".join([c for c in val if c in ID_ALLOWED_CHARS])
 
     @staticmethod
     def _to_class_str(classes: Sequence[str]) -> str:
@@ -47,7 +53,7 @@ class UtilsMixin(GlyphMixin):
 
         # wrap on word boundaries if a line is too long
         if line_width > 0 and len(lines) < truncate:
-            tw = TextWrapper(width=line_width, break_long_words=False, break_on_hyphens=False)
+            tw = _get_text_wrapper(line_width)
 
             wrapped: list[str] = []
             for i, line in enumerate(lines):
@@ -150,7 +156,7 @@ class UtilsMixin(GlyphMixin):
         if not words:
             return
 
-        is_layer = self.cfg.style_layer_activators and (layer_name := " ".join(words)) in self.layer_names
+        is_layer = self.cfg.style_layer_activators and (layer_name := " ".join(words)) in self.layer_ids
 
         classes = [*classes, legend_type]
         if is_layer:
@@ -162,7 +168,7 @@ class UtilsMixin(GlyphMixin):
                 return
 
         if is_layer:
-            self.out.write(f'<a href="#{self._str_to_id(layer_name)}">\n')
+            self.out.write(f'<a href="#{self.layer_ids[layer_name]}">\n')
 
         if len(words) == 1:
             self._draw_text(p, words[0], classes)
@@ -10,6 +10,7 @@ Node overrides via node references are supported in a limited capacity.
 
 import logging
 import re
+from functools import cache
 from io import StringIO
 from itertools import chain
 
@@ -22,6 +23,19 @@ logger = logging.getLogger(__name__)
 TS_LANG = Language(ts.language())
 
 
+@cache
+def _get_compatible_query(compatible_value: str) -> Query:
+    """Compile the query to find nodes with a given compatible value, once per value."""
+    return Query(
+        TS_LANG,
+        rf"""
+        (node (property name: (identifier) @prop value: (string_literal) @propval)
+          (#eq? @prop "compatible") (#eq? @propval "\"{compatible_value}\"")
+        ) @node
+        """,
+    )
+
+
 class DTNode:
     """Class representing a DT node with helper methods to extract fields."""
 
@@ -30,10 +44,11 @@ class DTNode:
     content: str
     children: list["DTNode"]
 
-    def __init__(self, node: Node, text_buf: bytes, override_nodes: list["DTNode"] | None = None):
+    def __init__(self, node: Node, text_buf: bytes, override_nodes: dict[str, list["DTNode"]] | None = None):
         """
         Initialize a node from its name (which may be in the form of `label:name`)
-        and `parse` which contains the node itself.
+        and `parse` which contains the node itself. `override_nodes` maps labels to
+        the `&label { ... };` nodes that override them.
         """
         self.node = node
         self.text_buf = text_buf
@@ -47,21 +62,21 @@ class DTNode:
         )
         self.overrides = []
         if override_nodes and self.label is not None:
-            # consider pre-compiling nodes by label for performance
-            self.overrides = [node for node in override_nodes if self.label == node.name.lstrip("&")]
+            self.overrides = override_nodes.get(self.label, [])
 
     def _get_content(self, node: Node) -> str:
         return self.text_buf[node.start_byte : node.end_byte].decode("utf-8").replace("\n", " ")
 
     def _get_property(self, property_re: str) -> list[Node] | None:
-        children = [node for node in self.node.children if node.type == "property"]
-        for override_node in self.overrides:
-            children += [node for node in override_node.node.children if node.type == "property"]
-        for child in children[::-1]:
-            name_node = child.child_by_field_name("name")
-            assert name_node is not None
-            if re.match(property_re, self._get_content(name_node)):
-                return child.children_by_field_name("value")
+        # later definitions take precedence, so walk overrides then the node itself in reverse order
+        for dt_node in (*reversed(self.overrides), self):
+            for child in reversed(dt_node.node.children):
+                if child.type != "property":
+                    continue
+                name_node = child.child_by_field_name("name")
+                assert name_node is not None
+                if re.match(property_re, self._get_content(name_node)):
+                    return child.children_by_field_name("value")
         return None
 
     def get_string(self, property_re: str) -> str | None:
@@ -107,7 +122,7 @@ class DTNode:
         )
 
 
-class DeviceTree:
+class DeviceTree:  # pylint: disable=too-many-instance-attributes
     """
     Class that parses a DTS file (optionally preprocessed by the C preprocessor)
     and provides methods to extract `compatible` and `chosen` nodes as DTNode's.
@@ -126,6 +141,7 @@ class DeviceTree:
         preprocess: bool = True,
         preamble: str | None = None,
         additional_includes: list[str] | None = None,
+        extra_data: str | None = None,
     ):
         """
         Given an input DTS string `in_str` and `file_name` it is read from, parse it to be
@@ -133,6 +149,8 @@ class DeviceTree:
         For performance reasons, the whole tree isn't parsed into DTNode's.
 
         If `preamble` is set to a non-empty string, prepend it to the read buffer.
+        If `extra_data` is set, it is preprocessed in the same pass as the input buffer and the
+        result is stored in `prepped_extra_data`, see `preprocess_extra_data`.
         """
         self.raw_buffer = in_str
         self.file_name = file_name
@@ -140,12 +158,20 @@ class DeviceTree:
         if preamble:
             self.raw_buffer = preamble + "\n" + self.raw_buffer
 
-        prepped = self._preprocess(self.raw_buffer, file_name, self.additional_includes) if preprocess else in_str
+        self.prepped_extra_data: str | None = None
+        if not preprocess:
+            prepped = in_str
+        elif extra_data is not None:
+            prepped, self.prepped_extra_data = self._preprocess_with_extra_data(extra_data)
+        else:
+            prepped = self._preprocess(self.raw_buffer, file_name, self.additional_includes)
 
         self.ts_buffer = prepped.encode("utf-8")
         tree = Parser(TS_LANG).parse(self.ts_buffer)
         self.root_nodes = self._find_root_ts_nodes(tree)
-        self.override_nodes = [DTNode(node, self.ts_buffer) for node in self._find_override_ts_nodes(tree)]
+        self.label_to_overrides: dict[str, list[DTNode]] = {}
+        for override_node in (DTNode(node, self.ts_buffer) for node in self._find_override_ts_nodes(tree)):
+            self.label_to_overrides.setdefault(override_node.name.lstrip("&"), []).append(override_node)
         self.chosen_nodes = [DTNode(node, self.ts_buffer) for node in self._find_chosen_ts_nodes(tree)]
 
     @classmethod
@@ -199,19 +225,10 @@ class DeviceTree:
 
     def get_compatible_nodes(self, compatible_value: str) -> list[DTNode]:
         """Return a list of nodes that have the given compatible value."""
-        query = QueryCursor(
-            Query(
-                TS_LANG,
-                rf"""
-                (node (property name: (identifier) @prop value: (string_literal) @propval)
-                  (#eq? @prop "compatible") (#eq? @propval "\"{compatible_value}\"")
-                ) @node
-                """,
-            )
-        )
+        query = QueryCursor(_get_compatible_query(compatible_value))
         nodes = chain.from_iterable(query.captures(node).get("node", []) for node in self.root_nodes)
         return sorted(
-            (DTNode(node, self.ts_buffer, self.override_nodes) for node in nodes), key=lambda x: x.node.start_byte
+            (DTNode(node, self.ts_buffer, self.label_to_overrides) for node in nodes), key=lambda x: x.node.start_byte
         )
 
     def get_chosen_property(self, property_name: str) -> str | None:
@@ -222,15 +239,8 @@ class DeviceTree:
                 phandle = val
         return phandle
 
-    def preprocess_extra_data(self, data: str) -> str:
-        """
-        Given a string containing data, preprocess it in the same context as the
-        original input buffer by appending the data to it and extracting the result
-        afterwards.
-
-        TODO(perf): Figure out a good interface to achieve this without running preprocessing
-        twice.
-        """
+    def _preprocess_with_extra_data(self, data: str) -> tuple[str, str]:
+        """Preprocess the input buffer with `data` appended, then return the two parts of the output separately."""
         in_str = self.raw_buffer + f"\n{self._custom_data_header}\n{data}"
         out = self._preprocess(in_str, self.file_name, self.additional_includes)
         data_pos = out.rfind(f"\n{self._custom_data_header}\n")
@@ -238,4 +248,12 @@ class DeviceTree:
             f"Preprocessing extra data failed, please make sure '{self._custom_data_header}' "
             "does not get modified by #define's"
         )
-        return out[data_pos + len(self._custom_data_header) + 2 :]
+        return out[:data_pos], out[data_pos + len(self._custom_data_header) + 2 :]
+
+    def preprocess_extra_data(self, data: str) -> str:
+        """
+        Given a string containing data, preprocess it in the same context as the
+        original input buffer by appending the data to it and extracting the result
+        afterwards.
+        """
+        return self._preprocess_with_extra_data(data)[1]
@@ -4,7 +4,7 @@ containing key and combo specifications, paired with the physical keyboard layou
 """
 
 from collections import defaultdict
-from functools import partial
+from functools import cache, partial
 from itertools import chain
 from typing import Callable, Iterable, Literal
 
@@ -13,6 +13,9 @@ from pydantic import AliasChoices, BaseModel, Field, field_validator, model_seri
 from keymap_drawer.config import Config
 from keymap_drawer.physical_layout import PhysicalLayout, PhysicalLayoutGenerator
 
+# full legend and tap legend indices of a layer's keys, mapping to first key positions
+LayerKeyIndex = tuple[dict[tuple, int], dict[str, int]]
+
 
 class LayoutKey(
     BaseModel, populate_by_name=True, coerce_numbers_to_str=True, extra="forbid"
@@ -177,29 +180,31 @@ class KeymapData(BaseModel):
     layout: PhysicalLayout | None = None
     config: Config | None = None
 
-    def _resolve_key_positions_from_trigger_keys(self, combo: ComboSpec) -> None:
+    @staticmethod
+    def _index_layer_keys(layer_keys: list[LayoutKey]) -> LayerKeyIndex:
+        """Map full legends and tap legends of keys to their first positions in the layer."""
+        full_index: dict[tuple, int] = {}
+        tap_index: dict[str, int] = {}
+        for ind, layer_key in enumerate(layer_keys):
+            full_index.setdefault(tuple(layer_key.full_serializer().items()), ind)
+            tap_index.setdefault(layer_key.tap, ind)
+        return full_index, tap_index
+
+    def _resolve_key_positions_from_trigger_keys(
+        self, combo: ComboSpec, get_layer_index: Callable[[str], LayerKeyIndex]
+    ) -> None:
         assert combo.trigger_keys
         for layer in combo.layers if combo.layers else list(self.layers):
+            full_index, tap_index = get_layer_index(layer)
+
             # try full legend match
-            matches = [
-                next(
-                    (ind for ind, layer_key in enumerate(self.layers[layer]) if key == layer_key),
-                    None,
-                )
-                for key in combo.trigger_keys
-            ]
+            matches = [full_index.get(tuple(key.full_serializer().items())) for key in combo.trigger_keys]
             if all(ind is not None for ind in matches):
                 combo.key_positions = matches  # type: ignore
                 return
 
             # try matching by only tap legend
-            matches = [
-                next(
-                    (ind for ind, layer_key in enumerate(self.layers[layer]) if key == LayoutKey(tap=layer_key.tap)),
-                    None,
-                )
-                for key in combo.trigger_keys
-            ]
+            matches = [tap_index.get(key.tap) if key == LayoutKey(tap=key.tap) else None for key in combo.trigger_keys]
             if all(ind is not None for ind in matches):
                 combo.key_positions = matches  # type: ignore
                 return
@@ -265,7 +270,7 @@ class KeymapData(BaseModel):
             base_combos_map[tuple(sorted(combo.key_positions))].append(combo)
 
         def combo_matcher(combo: ComboSpec, ref_layers: set[str]) -> int:
-            return len(ref_layers & set(combo.layers))
+            return len(ref_layers.intersection(combo.layers))
 
         new_combos = []
         for combo in self.combos:
@@ -320,9 +325,10 @@ class KeymapData(BaseModel):
     @model_validator(mode="after")
     def check_combos(self):
         """Resolve trigger keys if specified then validate combo positions are legitimate ones we can draw."""
+        get_layer_index = cache(lambda layer: self._index_layer_keys(self.layers[layer]))  # built lazily per layer
         for combo in self.combos:
             if combo.trigger_keys:
-                self._resolve_key_positions_from_trigger_keys(combo)
+                self._resolve_key_positions_from_trigger_keys(combo, get_layer_index)
 
             assert self.layout is None or all(
                 pos < len(self.layout) for pos in combo.key_positions
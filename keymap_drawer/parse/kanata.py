@@ -2,6 +2,7 @@
 
 import json
 import logging
+from functools import cache
 from itertools import batched, chain
 from pathlib import Path
 from typing import Iterable, Sequence
@@ -18,12 +19,14 @@ DEFSRC_CLASSES = Path(__file__).parent.parent.parent / "resources" / "kanata" /
 PHYSICAL_LAYOUTS = Path(__file__).parent.parent.parent / "resources" / "kanata" / "layout_srcs.json"
 
 
+@cache
 def _get_canonical_defsrc_lookup() -> dict[str, str]:
     with open(DEFSRC_CLASSES, "rb") as f:
         data = json.load(f)
     return {other: defsrc_class[0] for defsrc_class in data for other in defsrc_class}
 
 
+@cache
 def _get_layouts() -> list[dict]:
     with open(PHYSICAL_LAYOUTS, "rb") as f:
         layouts = json.load(f)
@@ -36,8 +39,6 @@ class KanataKeymapParser(KeymapParser):
     """Parser for Kanata cfg keymaps, using pyparsing-based parsers."""
 
     _modifier_fn_to_std = {}
-    _available_layouts: list[dict] = _get_layouts()
-    _canonical_defsrcs: dict[str, str] = _get_canonical_defsrc_lookup()
 
     def __init__(
         self,
@@ -79,7 +80,7 @@ class KanataKeymapParser(KeymapParser):
 
     @classmethod
     def _canonicalize_defsrc(cls, val: str) -> str:
-        if (canonical := cls._canonical_defsrcs.get(val)) is not None:
+        if (canonical := _get_canonical_defsrc_lookup().get(val)) is not None:
             return canonical
         raise ValueError(f'Unknown defsrc item "{val}"!')
 
@@ -87,14 +88,16 @@ class KanataKeymapParser(KeymapParser):
         canonical = [self._canonicalize_defsrc(val) for val in defsrc]
         extra = [] if extra_defsrc is None else [self._canonicalize_defsrc(val) for val in extra_defsrc]
 
-        for layout in self._available_layouts:
-            if all(val in layout["defsrc_index"] for val in (canonical + extra)):
+        required = set(canonical).union(extra)
+        available_layouts = _get_layouts()
+        for layout in available_layouts:
+            if required <= layout["defsrc_index"]:
                 self.defsrc_to_pos = {key: pos for pos, key in enumerate(layout["defsrc"])}
                 self.defsrc_indices = [self.defsrc_to_pos[val] for val in canonical]
                 self.physical_layout = layout["physical_layout"]
                 return
 
-        logger.debug("missing: %s", set(canonical + extra) - self._available_layouts[-1]["defsrc_index"])
+        logger.debug("missing: %s", required - available_layouts[-1]["defsrc_index"])
         raise ValueError("Cannot find a physical layout that contains all items in defsrc")
 
     def _get_aliases_vars(self, nodes: list[pp.ParseResults]) -> None:
@@ -119,8 +122,8 @@ class KanataKeymapParser(KeymapParser):
         key_positions: Sequence[int],
     ) -> LayoutKey:
         binding_str = self._element_to_str(binding)
-        if binding_str in self.raw_binding_map:
-            return LayoutKey.from_key_spec(self.raw_binding_map[binding_str])
+        if (raw_spec := self.raw_binding_map.get(binding_str)) is not None:
+            return LayoutKey.from_key_spec(raw_spec)
         if self.cfg.skip_binding_parsing:
             return LayoutKey(tap=binding_str)
 
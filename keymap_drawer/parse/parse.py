@@ -53,6 +53,7 @@ class KeymapParser(ABC):  # pylint: disable=too-many-instance-attributes
             self._mod_combs_lookup = {
                 frozenset(mods.split("+")): val for mods, val in mod_map.special_combinations.items()
             }
+            self._mod_fn_lookup = mod_map.model_dump()
 
     def parse_modifier_fns(self, keycode: str) -> tuple[str, list[str]]:
         """
@@ -83,7 +84,7 @@ class KeymapParser(ABC):  # pylint: disable=too-many-instance-attributes
         if (combo_str := self._mod_combs_lookup.get(frozenset(modifiers))) is not None:
             fns_str = combo_str
         else:
-            fn_map = self.cfg.modifier_fn_map.dict()
+            fn_map = self._mod_fn_lookup
             assert all(
                 mod in fn_map for mod in modifiers
             ), f"Not all modifier functions in {modifiers} have a corresponding mapping in parse_config.modifier_fn_map"
@@ -168,7 +169,7 @@ class KeymapParser(ABC):  # pylint: disable=too-many-instance-attributes
                     logger.warning("skipped assigning held key in index %d due to wrong layer length", key_idx)
                     continue
 
-                if is_alternate and "held" in key.type:  # do not override primary held with alternate
+                if is_alternate and "held" in key.type.split():  # do not override primary held with alternate
                     continue
 
                 key_type = "held alternate" if is_alternate else "held"
@@ -77,8 +77,8 @@ class QmkJsonParser(KeymapParser):
     def _str_to_key(  # pylint: disable=too-many-return-statements
         self, key_str: str, current_layer: int, key_positions: Sequence[int]
     ) -> LayoutKey:
-        if key_str in self.raw_binding_map:
-            return LayoutKey.from_key_spec(self.raw_binding_map[key_str])
+        if (raw_spec := self.raw_binding_map.get(key_str)) is not None:
+            return LayoutKey.from_key_spec(raw_spec)
         if self.cfg.skip_binding_parsing:
             return LayoutKey(tap=key_str)
 
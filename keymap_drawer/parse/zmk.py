@@ -64,7 +64,8 @@ class ZmkKeymapParser(KeymapParser):
 
     def _update_raw_binding_map(self, dts: DeviceTree) -> None:
         raw_keys = list(self.raw_binding_map.keys())
-        prep_keys = dts.preprocess_extra_data("\n".join(raw_keys)).splitlines()
+        assert dts.prepped_extra_data is not None
+        prep_keys = dts.prepped_extra_data.splitlines()
         assert len(raw_keys) == len(
             prep_keys
         ), "Keys in parse_config.raw_binding_map did not preprocess properly, please check for issues"
@@ -77,11 +78,11 @@ class ZmkKeymapParser(KeymapParser):
     def _str_to_key(  # pylint: disable=too-many-return-statements,too-many-locals
         self, binding: str, current_layer: int | None, key_positions: Sequence[int], no_shifted: bool = False
     ) -> LayoutKey:
-        if binding in self.raw_binding_map:
-            return LayoutKey.from_key_spec(self.raw_binding_map[binding])
+        if (raw_spec := self.raw_binding_map.get(binding)) is not None:
+            return LayoutKey.from_key_spec(raw_spec)
         binding_parts = binding.split()
-        if binding_parts[0] in self.raw_binding_map:
-            return LayoutKey.from_key_spec(self.raw_binding_map[binding_parts[0]])
+        if (raw_spec := self.raw_binding_map.get(binding_parts[0])) is not None:
+            return LayoutKey.from_key_spec(raw_spec)
         if self.cfg.skip_binding_parsing:
             return LayoutKey(tap=binding)
 
@@ -307,6 +308,7 @@ class ZmkKeymapParser(KeymapParser):
             self.cfg.preprocess,
             preamble=self.cfg.zmk_preamble + "\n" + _get_zmk_defines(),
             additional_includes=self.cfg.zmk_additional_includes,
+            extra_data="\n".join(self.raw_binding_map) if self.cfg.preprocess and self.raw_binding_map else None,
         )
 
         if self.cfg.preprocess and self.raw_binding_map:
@@ -16,10 +16,10 @@ from typing import ClassVar, Literal
 from urllib.error import HTTPError
 from urllib.request import urlopen
 
-import yaml
 from platformdirs import user_cache_dir
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from keymap_drawer import yaml_load
 from keymap_drawer.config import Config, ParseConfig
 from keymap_drawer.dts import DeviceTree
 
@@ -530,12 +530,19 @@ class QmkLayout(BaseModel):
         ).normalize()
 
 
-def _map_zmk_layout(zmk_keyboard: str, layout_name: str | None) -> dict[str, str | None]:
-    @cache
-    def _get_zmk_layouts() -> dict:
-        with open(ZMK_LAYOUTS_PATH, "rb") as f:
-            return yaml.safe_load(f)
+@cache
+def _get_zmk_layouts() -> dict:
+    with open(ZMK_LAYOUTS_PATH, "rb") as f:
+        return yaml_load(f)
+
+
+@cache
+def _get_qmk_mappings() -> dict[str, str]:
+    with open(QMK_MAPPINGS_PATH, "rb") as f:
+        return yaml_load(f)
 
+
+def _map_zmk_layout(zmk_keyboard: str, layout_name: str | None) -> dict[str, str | None]:
     keyboard_to_layout_map = _get_zmk_layouts()
 
     if (keyboard_layouts := keyboard_to_layout_map.get(zmk_keyboard)) is None:
@@ -551,12 +558,7 @@ def _map_zmk_layout(zmk_keyboard: str, layout_name: str | None) -> dict[str, str
 
 
 def _map_qmk_keyboard(qmk_keyboard: str) -> str:
-    @cache
-    def get_qmk_mappings() -> dict[str, str]:
-        with open(QMK_MAPPINGS_PATH, "rb") as f:
-            return yaml.safe_load(f)
-
-    mappings = get_qmk_mappings()
+    mappings = _get_qmk_mappings()
     if to_keyboard := mappings.get(qmk_keyboard):
         return to_keyboard
 